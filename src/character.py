@@ -1,20 +1,62 @@
 """Character sprite with animations and wave mode."""
 import arcade
-from math import pi
+from math import pi, cos, sin
 from constants import CHARACTER_SCALE, WAVE_MODE_ALPHA
 
 
 class Character(arcade.Sprite):
     """Character with animation support"""
 
+    # Shared textures, filled on first construction
+    _IDLE_CACHE = None
+    _RUN_CACHE = {}
+
     def __init__(self):
         super().__init__()
 
-        # Load character textures
-        self.idle_textures = []
-        self.run_textures = []
-        self.run_left_textures = []
-        self.run_right_textures = []
+        # Textures are loaded once and shared by every Character, so a restart
+        # only builds the sprite
+        if Character._IDLE_CACHE is None:
+            Character._load_textures()
+        self.idle_textures = Character._IDLE_CACHE
+        self.run_textures = Character._RUN_CACHE["forward"]
+        self.run_left_textures = Character._RUN_CACHE["left"]
+        self.run_right_textures = Character._RUN_CACHE["right"]
+
+        # Set initial texture
+        self.texture = self.run_textures[0] if self.run_textures else self.idle_textures[0]
+        self.scale = CHARACTER_SCALE
+
+        # Animation state
+        self.current_frame = 0
+        self.current_animation = "forward"
+        self.current_textures = self.run_textures
+        # Seconds accumulated towards the next frame, and seconds per frame
+        self._anim_accum = 0.0
+        self._anim_period = 0.1
+
+        # Movement direction (in radians)
+        self.direction = 0
+
+        # cos/sin of direction, recomputed only when it changes
+        self._dir_cos = 1.0
+        self._dir_sin = 0.0
+        self._dir_cached = 0
+
+        # Isometric position tracking
+        self.iso_x = 0
+        self.iso_y = 0
+
+        # Wave mode state
+        self.in_wave_mode = False
+
+    @classmethod
+    def _load_textures(cls):
+        """Load the idle and run animations into the class caches"""
+        idle_textures = []
+        run_textures = []
+        run_left_textures = []
+        run_right_textures = []
 
         try:
             # Load idle animations
@@ -30,7 +72,7 @@ class Character(arcade.Sprite):
             ]
             for pattern in idle_patterns:
                 texture = arcade.load_texture(pattern)
-                self.idle_textures.append(texture)
+                idle_textures.append(texture)
 
             # Load forward run animations
             run_patterns = [
@@ -46,7 +88,7 @@ class Character(arcade.Sprite):
             for pattern in run_patterns:
                 try:
                     texture = arcade.load_texture(pattern)
-                    self.run_textures.append(texture)
+                    run_textures.append(texture)
                 except Exception as e:
                     print(f"Could not load {pattern}: {e}")
 
@@ -64,7 +106,7 @@ class Character(arcade.Sprite):
             for pattern in left_patterns:
                 try:
                     texture = arcade.load_texture(pattern)
-                    self.run_left_textures.append(texture)
+                    run_left_textures.append(texture)
                 except Exception as e:
                     print(f"Could not load {pattern}: {e}")
 
@@ -82,7 +124,7 @@ class Character(arcade.Sprite):
             for pattern in right_patterns:
                 try:
                     texture = arcade.load_texture(pattern)
-                    self.run_right_textures.append(texture)
+                    run_right_textures.append(texture)
                 except Exception as e:
                     print(f"Could not load {pattern}: {e}")
 
@@ -90,61 +132,53 @@ class Character(arcade.Sprite):
             print(f"Error loading character textures: {e}")
 
         # Fallback if no textures loaded
-        if not self.idle_textures:
-            self.idle_textures = [arcade.make_soft_square_texture(32, arcade.color.BLUE, 255, 255)]
-        if not self.run_textures:
-            self.run_textures = self.idle_textures
-        if not self.run_left_textures:
-            self.run_left_textures = self.run_textures
-        if not self.run_right_textures:
-            self.run_right_textures = self.run_textures
-
-        # Set initial texture
-        self.texture = self.run_textures[0] if self.run_textures else self.idle_textures[0]
-        self.scale = CHARACTER_SCALE
-
-        # Animation state
-        self.current_frame = 0
-        self.frame_counter = 0
-        self.current_animation = "forward"
-
-        # Movement direction (in radians)
-        self.direction = 0
-
-        # Isometric position tracking
-        self.iso_x = 0
-        self.iso_y = 0
-
-        # Wave mode state
-        self.in_wave_mode = False
+        if not idle_textures:
+            idle_textures = [arcade.make_soft_square_texture(32, arcade.color.BLUE, 255, 255)]
+        if not run_textures:
+            run_textures = idle_textures
+        if not run_left_textures:
+            run_left_textures = run_textures
+        if not run_right_textures:
+            run_right_textures = run_textures
+
+        cls._IDLE_CACHE = idle_textures
+        cls._RUN_CACHE = {
+            "forward": run_textures,
+            "left": run_left_textures,
+            "right": run_right_textures,
+        }
 
     def update_animation(self, delta_time=1 / 60, turn_direction=0):
         """Update character animation based on movement direction"""
-        self.frame_counter += 1
-
         # Determine which animation to use
         if turn_direction > 0:
             target_animation = "left"
-            texture_list = self.run_left_textures
         elif turn_direction < 0:
             target_animation = "right"
-            texture_list = self.run_right_textures
         else:
             target_animation = "forward"
-            texture_list = self.run_textures
 
-        # Reset frame if animation changed
+        # Restart from the first frame if the animation changed
         if target_animation != self.current_animation:
             self.current_animation = target_animation
+            self.current_textures = Character._RUN_CACHE[target_animation]
             self.current_frame = 0
-            self.frame_counter = 0
-
-        # Change frame every 6 updates
-        if self.frame_counter >= 6:
-            self.frame_counter = 0
-            if texture_list:
-                self.current_frame = (self.current_frame + 1) % len(texture_list)
-                self.texture = texture_list[self.current_frame]
+            self._anim_accum = 0.0
+
+        # Advance a frame every _anim_period seconds, whatever the frame rate
+        self._anim_accum += delta_time
+        if self._anim_accum >= self._anim_period:
+            self._anim_accum -= self._anim_period
+            self.current_frame = (self.current_frame + 1) % len(self.current_textures)
+            self.texture = self.current_textures[self.current_frame]
+
+    def heading(self):
+        """Return (cos, sin) of the movement direction"""
+        if self._dir_cached != self.direction:
+            self._dir_cos = cos(self.direction)
+            self._dir_sin = sin(self.direction)
+            self._dir_cached = self.direction
+        return self._dir_cos, self._dir_sin
 
     def set_wave_mode(self, enabled):
         """Toggle wave mode visual effect"""
@@ -0,0 +1,13 @@
+"""Per-chunk terrain data and the sprites built from it."""
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ChunkData:
+    """A built chunk: the terrain mode it came from and its sprites"""
+    # Terrain mode the chunk was generated in
+    terrain_mode: str
+    # Sprites of this chunk keyed by scene layer name
+    sprites_by_layer: dict = field(default_factory=dict)
+    # Walls and coins of this chunk in draw order
+    depth_sorted: list = field(default_factory=list)
@@ -10,6 +10,9 @@ SCREEN_TITLE = "Procedural Forest Terrain - Infinite Runner"
 TILE_WIDTH = 128
 TILE_HEIGHT = 64
 
+# Shared texture atlas, large enough for all terrain and character frames
+TEXTURE_ATLAS_SIZE = (4096, 4096)
+
 # Camera movement speed
 CAMERA_SPEED = 10
 
@@ -20,7 +23,11 @@ CHARACTER_SCALE = 1.0
 
 # Chunk settings
 CHUNK_SIZE = 16
-RENDER_DISTANCE = 4
+# Extra margin around the camera view, in chunk extents, that is kept loaded
+VIEW_MARGIN_CHUNKS = 1
+HIBERNATED_CHUNK_LIMIT = 64
+CHUNK_WORKERS = 2
+CHUNK_BUILDS_PER_FRAME = 4
 
 # Master seed for reproducible terrain
 MASTER_SEED = 12345
@@ -48,4 +55,9 @@ COIN_SPAWN_CHANCE = 0.15
 
 # Health settings
 MAX_HEALTH = 100
-HEALTH_PENALTY = 2
\ No newline at end of file
+HEALTH_PENALTY = 2
+
+# Terrain cache settings
+TERRAIN_CACHE_PATH = "terrain_cache.db"
+TERRAIN_CACHE_VERSION = 4
+TERRAIN_CACHE_MEMORY_CHUNKS = 256
@@ -0,0 +1,43 @@
+"""Terrain element ids and per-element lookup tables."""
+from enum import IntEnum
+
+import numpy as np
+
+from utils import get_hitbox_for_element, has_collision
+
+
+class Elem(IntEnum):
+    """
+    Terrain element ids stored in chunk layouts.
+    The first ones follow the density bands of terrain_type_from_density,
+    the rest only come from random generation.
+    """
+    NONE = 0
+    TREE_THIN = 1
+    TREE_OAK_FALL = 2
+    TREE_FAT_FALL = 3
+    STONE_LARGE = 4
+    STONE_TALL = 5
+    LOG = 6
+    BUSH_SMALL = 7
+    TREE_BLOCKS_FALL = 8
+    TREE_DEFAULT_FALL = 9
+    TREE_THIN_FALL = 10
+    LOG_LARGE = 11
+
+
+# Texture name of each element, indexed by Elem
+TERRAIN_ELEMENTS = (None, 'tree_thin', 'tree_oak_fall', 'tree_fat_fall',
+                    'stone_large', 'stone_tall', 'log', 'bush_small',
+                    'tree_blocks_fall', 'tree_default_fall', 'tree_thin_fall', 'log_large')
+
+# Whether each element blocks the character, indexed by Elem
+HAS_COLLISION = np.array([element is not None and has_collision(element) for element in TERRAIN_ELEMENTS],
+                         dtype=bool)
+
+# Hitbox outline of each colliding element, indexed by Elem. Built once
+# here and shared by every sprite of that element
+HITBOX_POINTS = tuple(
+    get_hitbox_for_element(element) if collides else None
+    for element, collides in zip(TERRAIN_ELEMENTS, HAS_COLLISION)
+)
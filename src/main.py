@@ -2,14 +2,35 @@
 import time
 import math
 import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import arcade
+import numpy as np
+from PIL import Image
 from math import pi, cos, sin
 
 from constants import *
 from character import Character
-from terrain_generation import hybrid_terrain
-from utils import (iso_to_screen, screen_to_chunk, get_chunk_seed,
-                   get_hitbox_for_element, has_collision)
+from chunk_data import ChunkData
+from terrain_cache import TerrainCache
+from elements import TERRAIN_ELEMENTS, HAS_COLLISION, HITBOX_POINTS
+from terrain_generation import generate_chunk_layout
+from utils import iso_to_screen, screen_to_chunk, chunk_screen_bounds
+
+# Scene layers that hold chunk sprites
+CHUNK_LAYERS = (LAYER_NAME_GROUND, LAYER_NAME_OBJECTS, LAYER_NAME_WALLS, LAYER_NAME_COINS)
+
+# Screen offset of every tile in a chunk relative to the chunk's first tile
+_LOCAL_OFFSETS = np.empty((CHUNK_SIZE, CHUNK_SIZE, 2), dtype=np.float32)
+_X, _Y = np.meshgrid(np.arange(CHUNK_SIZE), np.arange(CHUNK_SIZE), indexing='ij')
+_LOCAL_OFFSETS[..., 0] = (_X - _Y) * (TILE_WIDTH / 2)
+_LOCAL_OFFSETS[..., 1] = (_X + _Y) * (TILE_HEIGHT / 2)
+del _X, _Y
+
+
+def depth_order(sprite):
+    """Sort key drawing sprites further up the screen first"""
+    return -sprite.center_y
 
 
 class ProceduralForestTerrain(arcade.Window):
@@ -19,16 +40,44 @@ class ProceduralForestTerrain(arcade.Window):
 
         # Camera setup
         self.camera = arcade.camera.Camera2D()
+        # Screen-space camera for the UI
+        self._ui_camera = arcade.camera.Camera2D()
 
         # Scene to manage all sprites
         self.scene = None
 
+        # One atlas shared by every sprite list so drawing binds a single texture
+        self.atlas = arcade.DefaultTextureAtlas(TEXTURE_ATLAS_SIZE)
+
+        # Walls, coins and characters drawn in depth order. Kept across frames
+        # and fed pre-sorted runs per chunk, so re-sorting it only merges runs
+        self.depth_sorted_list = arcade.SpriteList(atlas=self.atlas)
+
         # Load textures
         self.textures = {}
+        # Texture of each terrain element indexed by Elem, None where missing
+        self.textures_by_id = []
+        # Per-id flags of elements that become walls or plain objects
+        self.wall_id_mask = None
+        self.object_id_mask = None
+
+        # Ground of a whole chunk is one sprite; its center relative to the chunk origin
+        self.chunk_ground_offset = (0, 0)
 
         # Store active chunks
         self.chunks = {}
 
+        # Chunks out of range, kept with their sprites detached from the scene
+        self.hibernated_chunks = OrderedDict()
+
+        # Generated chunk layouts, reused when a chunk is revisited
+        self.terrain_cache = TerrainCache(TERRAIN_CACHE_PATH, TERRAIN_CACHE_MEMORY_CHUNKS)
+
+        # Chunk layouts are loaded or generated off the main thread; only the
+        # sprites are built here once a layout is ready
+        self.chunk_executor = ThreadPoolExecutor(max_workers=CHUNK_WORKERS)
+        self.pending_chunks = {}
+
         # Character
         self.character = None
 
@@ -97,6 +146,38 @@ class ProceduralForestTerrain(arcade.Window):
             print(f"Error loading textures: {e}")
             self.textures['grass'] = arcade.load_texture(":resources:images/tiles/grassCenter.png")
 
+        self.textures['chunk_ground'] = self.make_chunk_ground_texture(self.textures['grass'])
+
+        for texture in self.textures.values():
+            self.atlas.add(texture)
+
+        self.textures_by_id = [self.textures.get(element) for element in TERRAIN_ELEMENTS]
+
+        # Which ids become walls and which plain objects; ids without a texture are neither
+        has_texture = np.array([texture is not None for texture in self.textures_by_id], dtype=bool)
+        self.wall_id_mask = has_texture & HAS_COLLISION
+        self.object_id_mask = has_texture & ~HAS_COLLISION
+
+    def make_chunk_ground_texture(self, grass):
+        """Composite the grass of every tile in a chunk into one texture"""
+        # Tiles are drawn at half size, as the per-tile grass sprites used to be
+        tile_width = round(grass.width * 0.5)
+        tile_height = round(grass.height * 0.5)
+        tile_image = grass.image.convert("RGBA").resize((tile_width, tile_height), Image.LANCZOS)
+
+        offsets = _LOCAL_OFFSETS.reshape(-1, 2)
+        min_x, min_y = offsets.min(axis=0)
+        max_x, max_y = offsets.max(axis=0)
+        self.chunk_ground_offset = (float(min_x + max_x) / 2, float(min_y + max_y) / 2)
+
+        ground = Image.new("RGBA", (int(max_x - min_x) + tile_width, int(max_y - min_y) + tile_height))
+        # Paste in the same x-major order the tiles were drawn in; image y points down
+        for offset_x, offset_y in offsets.tolist():
+            ground.alpha_composite(tile_image, (int(offset_x - min_x), int(max_y - offset_y)))
+
+        return arcade.Texture(ground, hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+                              hash="chunk_ground")
+
     def setup(self):
         """Set up initial scene, chunks and character"""
         self.scene = arcade.Scene()
@@ -111,11 +192,18 @@ class ProceduralForestTerrain(arcade.Window):
         self.running_player = arcade.play_sound(self.running_music, volume=0.2, loop=True)
 
         # Add sprite lists for different layers
-        self.scene.add_sprite_list(LAYER_NAME_GROUND, use_spatial_hash=True)
-        self.scene.add_sprite_list(LAYER_NAME_OBJECTS, use_spatial_hash=True)
-        self.scene.add_sprite_list(LAYER_NAME_WALLS, use_spatial_hash=True)
-        self.scene.add_sprite_list(LAYER_NAME_COINS, use_spatial_hash=True)
-        self.scene.add_sprite_list(LAYER_NAME_CHARACTERS)
+        for layer_name in (LAYER_NAME_GROUND, LAYER_NAME_OBJECTS, LAYER_NAME_WALLS, LAYER_NAME_COINS):
+            self.scene.add_sprite_list(
+                layer_name,
+                sprite_list=arcade.SpriteList(use_spatial_hash=True, atlas=self.atlas)
+            )
+        self.scene.add_sprite_list(LAYER_NAME_CHARACTERS, sprite_list=arcade.SpriteList(atlas=self.atlas))
+        self.depth_sorted_list.clear()
+
+        # Chunks of a previous game had their sprites in the old scene
+        self.chunks.clear()
+        self.hibernated_chunks.clear()
+        self.cancel_pending_chunks()
 
         # Create character
         self.character = Character()
@@ -125,13 +213,19 @@ class ProceduralForestTerrain(arcade.Window):
         self.character.iso_y = 0
         self.character.direction = pi / 4
 
+        for texture_list in (self.character.idle_textures, self.character.run_textures,
+                             self.character.run_left_textures, self.character.run_right_textures):
+            for texture in texture_list:
+                self.atlas.add(texture)
+
         self.start_x = self.character.center_x
         self.start_y = self.character.center_y
 
         self.scene.add_sprite(LAYER_NAME_CHARACTERS, self.character)
+        self.depth_sorted_list.append(self.character)
 
         # Generate initial chunks
-        self.update_chunks()
+        self.update_chunks(wait=True)
 
         # Initialize physics engine
         self.physics_engine = arcade.PhysicsEngineSimple(
@@ -218,120 +312,199 @@ class ProceduralForestTerrain(arcade.Window):
             arcade.color.LIGHT_GREEN, 14, bold=True
         )
 
-    def generate_terrain_element(self, tile_x, tile_y, rng):
-        """Determine what terrain element to place at this position"""
-        if self.terrain_mode == 'quantum':
-            return hybrid_terrain(tile_x, tile_y, self.wave_mode_active)
-
-        # Random generation fallback
-        noise = rng.random()
-        if noise < 0.35:
-            tree_type = rng.random()
-            if tree_type < 0.3:
-                return 'tree_blocks_fall'
-            elif tree_type < 0.5:
-                return 'tree_oak_fall'
-            elif tree_type < 0.7:
-                return 'tree_default_fall'
-            elif tree_type < 0.85:
-                return 'tree_fat_fall'
-            else:
-                return 'tree_thin_fall'
-        elif noise < 0.40:
-            return 'stone_tall' if rng.random() < 0.7 else 'stone_large'
-        elif noise < 0.43:
-            return 'log' if rng.random() < 0.6 else 'log_large'
-        elif noise < 0.48:
-            return 'bush_small'
-        else:
-            return None
+    def load_chunk_layout(self, chunk_x, chunk_y, terrain_mode, wave_mode):
+        """Fetch a chunk layout from the cache, generating it on a miss"""
+        # Key by everything that affects generation
+        key = f"{TERRAIN_CACHE_VERSION}:{terrain_mode}:{int(wave_mode)}:{chunk_x}:{chunk_y}"
+        layout = self.terrain_cache.get(key)
+        if layout is None:
+            layout = generate_chunk_layout(chunk_x, chunk_y, terrain_mode, wave_mode)
+            self.terrain_cache.put(key, layout)
+        return layout
 
-    def create_chunk(self, chunk_x, chunk_y):
-        """Create a chunk of tiles and add to scene"""
-        chunk_seed = get_chunk_seed(chunk_x, chunk_y)
-        rng = random.Random(chunk_seed)
+    def create_chunk(self, chunk_x, chunk_y, layout):
+        """Create a chunk of tiles from its layout and add to scene"""
+        element_ids, coins = layout
 
         start_tile_x = chunk_x * CHUNK_SIZE
         start_tile_y = chunk_y * CHUNK_SIZE
 
-        chunk_sprites = {
-            'ground': [],
-            'objects': [],
-            'walls': [],
-            'coins': []
-        }
-
-        for x in range(CHUNK_SIZE):
-            for y in range(CHUNK_SIZE):
-                tile_x = start_tile_x + x
-                tile_y = start_tile_y + y
-
-                screen_x, screen_y = iso_to_screen(tile_x, tile_y)
-
-                # Create ground sprite
-                grass_sprite = arcade.Sprite()
-                grass_sprite.texture = self.textures['grass']
-                grass_sprite.center_x = screen_x
-                grass_sprite.center_y = screen_y
-                grass_sprite.scale = 0.5
-                self.scene.add_sprite(LAYER_NAME_GROUND, grass_sprite)
-                chunk_sprites['ground'].append(grass_sprite)
-
-                # Generate terrain element
-                element = self.generate_terrain_element(tile_x, tile_y, rng)
-                if element and element in self.textures:
-                    detail_sprite = arcade.Sprite()
-                    detail_sprite.texture = self.textures[element]
-                    detail_sprite.center_x = screen_x
-                    detail_sprite.center_y = screen_y
-                    detail_sprite.scale = 0.4
-                    detail_sprite.iso_x = tile_x
-                    detail_sprite.iso_y = tile_y
-
-                    if has_collision(element):
-                        hitbox_points = get_hitbox_for_element(element)
-                        detail_sprite.hit_box = arcade.hitbox.HitBox(
-                            hitbox_points,
-                            position=(detail_sprite.center_x, detail_sprite.center_y)
-                        )
-                        self.scene.add_sprite(LAYER_NAME_WALLS, detail_sprite)
-                        chunk_sprites['walls'].append(detail_sprite)
-                    else:
-                        self.scene.add_sprite(LAYER_NAME_OBJECTS, detail_sprite)
-                        chunk_sprites['objects'].append(detail_sprite)
-
-                if element is None and rng.random() < COIN_SPAWN_CHANCE:
-                    coin_sprite = arcade.Sprite()
-                    coin_sprite.texture = self.textures['coin']
-                    coin_sprite.center_x = screen_x
-                    coin_sprite.center_y = screen_y + 10
-                    coin_sprite.scale = 0.1
-                    self.scene.add_sprite(LAYER_NAME_COINS, coin_sprite)
-                    chunk_sprites['coins'].append(coin_sprite)
-
-        return chunk_sprites
-
-    def update_chunks(self):
-        """Update chunks based on camera position"""
-        center_chunk_x, center_chunk_y = screen_to_chunk(
-            self.camera.position[0] + SCREEN_WIDTH / 2,
-            self.camera.position[1] + SCREEN_HEIGHT / 2
-        )
-
-        chunks_needed = set()
-        for dx in range(-RENDER_DISTANCE, RENDER_DISTANCE + 1):
-            for dy in range(-RENDER_DISTANCE, RENDER_DISTANCE + 1):
-                chunks_needed.add((center_chunk_x + dx, center_chunk_y + dy))
+        # Screen position of every tile, indexed [x][y]
+        base_x, base_y = iso_to_screen(start_tile_x, start_tile_y)
+        screen = (_LOCAL_OFFSETS + (base_x, base_y)).tolist()
+
+        chunk = ChunkData(self.terrain_mode, {layer_name: [] for layer_name in CHUNK_LAYERS})
+        sprites = chunk.sprites_by_layer
+
+        # Create ground sprite covering the whole chunk
+        ground_sprite = arcade.Sprite()
+        ground_sprite.texture = self.textures['chunk_ground']
+        ground_sprite.center_x = base_x + self.chunk_ground_offset[0]
+        ground_sprite.center_y = base_y + self.chunk_ground_offset[1]
+        self.scene.add_sprite(LAYER_NAME_GROUND, ground_sprite)
+        sprites[LAYER_NAME_GROUND].append(ground_sprite)
+
+        # Split the tiles by what they become up front so the loops below
+        # need no per-tile checks
+        ids = element_ids.tolist()
+        walls = sprites[LAYER_NAME_WALLS]
+        for x, y in np.argwhere(self.wall_id_mask[element_ids]).tolist():
+            element_id = ids[x][y]
+            screen_x, screen_y = screen[x][y]
+
+            wall_sprite = arcade.Sprite()
+            wall_sprite.texture = self.textures_by_id[element_id]
+            wall_sprite.center_x = screen_x
+            wall_sprite.center_y = screen_y
+            wall_sprite.scale = 0.4
+            wall_sprite.iso_x = start_tile_x + x
+            wall_sprite.iso_y = start_tile_y + y
+            wall_sprite.hit_box = arcade.hitbox.HitBox(HITBOX_POINTS[element_id], position=(screen_x, screen_y))
+            self.scene.add_sprite(LAYER_NAME_WALLS, wall_sprite)
+            walls.append(wall_sprite)
+
+        objects = sprites[LAYER_NAME_OBJECTS]
+        for x, y in np.argwhere(self.object_id_mask[element_ids]).tolist():
+            screen_x, screen_y = screen[x][y]
+
+            detail_sprite = arcade.Sprite()
+            detail_sprite.texture = self.textures_by_id[ids[x][y]]
+            detail_sprite.center_x = screen_x
+            detail_sprite.center_y = screen_y
+            detail_sprite.scale = 0.4
+            detail_sprite.iso_x = start_tile_x + x
+            detail_sprite.iso_y = start_tile_y + y
+            self.scene.add_sprite(LAYER_NAME_OBJECTS, detail_sprite)
+            objects.append(detail_sprite)
+
+        for x, y in coins:
+            screen_x, screen_y = screen[x][y]
+
+            coin_sprite = arcade.Sprite()
+            coin_sprite.texture = self.textures['coin']
+            coin_sprite.center_x = screen_x
+            coin_sprite.center_y = screen_y + 10
+            coin_sprite.scale = 0.1
+            self.scene.add_sprite(LAYER_NAME_COINS, coin_sprite)
+            sprites[LAYER_NAME_COINS].append(coin_sprite)
+
+        # Walls and coins never move, so sort them once here
+        chunk.depth_sorted = sorted(sprites[LAYER_NAME_WALLS] + sprites[LAYER_NAME_COINS], key=depth_order)
+        self.depth_sorted_list.extend(chunk.depth_sorted)
+
+        return chunk
+
+    def update_chunks(self, wait=False):
+        """
+        Update chunks based on camera position.
+        New chunks are generated in the background unless wait is set.
+        """
+        chunks_needed = self.visible_chunks()
 
         # Remove far chunks
         chunks_to_remove = [pos for pos in self.chunks.keys() if pos not in chunks_needed]
         for chunk_pos in chunks_to_remove:
-            del self.chunks[chunk_pos]
+            self.hibernate_chunk(chunk_pos)
 
         # Create new chunks
         for chunk_pos in chunks_needed:
-            if chunk_pos not in self.chunks:
-                self.chunks[chunk_pos] = self.create_chunk(*chunk_pos)
+            if chunk_pos in self.chunks or chunk_pos in self.pending_chunks:
+                continue
+
+            chunk = self.wake_chunk(chunk_pos)
+            if chunk is not None:
+                self.chunks[chunk_pos] = chunk
+            elif wait:
+                layout = self.load_chunk_layout(*chunk_pos, self.terrain_mode, self.wave_mode_active)
+                self.chunks[chunk_pos] = self.create_chunk(*chunk_pos, layout)
+            else:
+                self.pending_chunks[chunk_pos] = self.chunk_executor.submit(
+                    self.load_chunk_layout, *chunk_pos, self.terrain_mode, self.wave_mode_active
+                )
+
+        self.build_pending_chunks(chunks_needed)
+
+    def build_pending_chunks(self, chunks_needed):
+        """Build sprites for a bounded number of chunks whose layouts are ready"""
+        built = 0
+        for chunk_pos, future in list(self.pending_chunks.items()):
+            if built >= CHUNK_BUILDS_PER_FRAME:
+                break
+            if not future.done():
+                continue
+
+            del self.pending_chunks[chunk_pos]
+            layout = future.result()
+            # The layout stays cached even if the player has moved on
+            if chunk_pos in chunks_needed:
+                self.chunks[chunk_pos] = self.create_chunk(*chunk_pos, layout)
+                built += 1
+
+    def cancel_pending_chunks(self):
+        """Drop layouts still being loaded; any that finish stay in the cache"""
+        for future in self.pending_chunks.values():
+            future.cancel()
+        self.pending_chunks.clear()
+
+    def visible_chunks(self):
+        """Chunks whose screen area overlaps the camera view plus a margin"""
+        camera_x, camera_y = self.camera.position
+        half_width = SCREEN_WIDTH / 2 + VIEW_MARGIN_CHUNKS * CHUNK_SIZE * TILE_WIDTH / 2
+        half_height = SCREEN_HEIGHT / 2 + VIEW_MARGIN_CHUNKS * CHUNK_SIZE * TILE_HEIGHT / 2
+        view = arcade.LRBT(camera_x - half_width, camera_x + half_width,
+                           camera_y - half_height, camera_y + half_height)
+
+        # The chunks under the view corners bound every chunk that can overlap it
+        corners = [screen_to_chunk(x, y) for x in (view.left, view.right) for y in (view.bottom, view.top)]
+        min_chunk_x = min(chunk_x for chunk_x, _ in corners)
+        max_chunk_x = max(chunk_x for chunk_x, _ in corners)
+        min_chunk_y = min(chunk_y for _, chunk_y in corners)
+        max_chunk_y = max(chunk_y for _, chunk_y in corners)
+
+        chunks = set()
+        for chunk_x in range(min_chunk_x, max_chunk_x + 1):
+            for chunk_y in range(min_chunk_y, max_chunk_y + 1):
+                if arcade.LRBT(*chunk_screen_bounds(chunk_x, chunk_y)).overlaps(view):
+                    chunks.add((chunk_x, chunk_y))
+        return chunks
+
+    def hibernate_chunk(self, chunk_pos):
+        """Detach a chunk's sprites from the scene but keep them for reuse"""
+        chunk = self.chunks.pop(chunk_pos)
+        sprites_by_layer = chunk.sprites_by_layer
+
+        # Collected coins are no longer in any sprite list
+        sprites_by_layer[LAYER_NAME_COINS] = [
+            coin for coin in sprites_by_layer[LAYER_NAME_COINS] if coin.sprite_lists
+        ]
+        chunk.depth_sorted = [sprite for sprite in chunk.depth_sorted if sprite.sprite_lists]
+
+        for sprites in sprites_by_layer.values():
+            for sprite in sprites:
+                sprite.remove_from_sprite_lists()
+
+        self.hibernated_chunks[chunk_pos] = chunk
+        if len(self.hibernated_chunks) > HIBERNATED_CHUNK_LIMIT:
+            self.hibernated_chunks.popitem(last=False)
+
+    def wake_chunk(self, chunk_pos):
+        """Re-attach a hibernated chunk's sprites, or return None if it has none in this mode"""
+        chunk = self.hibernated_chunks.pop(chunk_pos, None)
+        # Chunks from before a terrain mode switch are regenerated in the new mode
+        if chunk is None or chunk.terrain_mode != self.terrain_mode:
+            return None
+
+        for layer_name, sprites in chunk.sprites_by_layer.items():
+            self.scene[layer_name].extend(sprites)
+        self.depth_sorted_list.extend(chunk.depth_sorted)
+
+        return chunk
+
+    def on_close(self):
+        """Stop chunk generation and flush the terrain cache before the window closes"""
+        self.chunk_executor.shutdown(wait=True, cancel_futures=True)
+        self.terrain_cache.close()
+        super().on_close()
 
     def on_key_press(self, key, modifiers):
         """Handle key press"""
@@ -350,6 +523,9 @@ class ProceduralForestTerrain(arcade.Window):
                 self.character.set_wave_mode(True)
         elif key == arcade.key.Q:
             self.terrain_mode = 'random' if self.terrain_mode == 'quantum' else 'quantum'
+            # Revisited and still loading terrain should be generated in the new mode
+            self.hibernated_chunks.clear()
+            self.cancel_pending_chunks()
             print(f"Switched to {'Random' if self.terrain_mode == 'random' else 'Quantum'} Terrain Generation")
 
     def on_key_release(self, key, modifiers):
@@ -420,8 +596,9 @@ class ProceduralForestTerrain(arcade.Window):
             self.character.direction += self.turn_direction * TURN_SPEED
 
         # Move forward
-        self.character.change_x = math.cos(self.character.direction) * CHARACTER_SPEED
-        self.character.change_y = math.sin(self.character.direction) * CHARACTER_SPEED
+        dir_cos, dir_sin = self.character.heading()
+        self.character.change_x = dir_cos * CHARACTER_SPEED
+        self.character.change_y = dir_sin * CHARACTER_SPEED
 
         old_x = self.character.center_x
         old_y = self.character.center_y
@@ -481,16 +658,9 @@ class ProceduralForestTerrain(arcade.Window):
         self.scene[LAYER_NAME_GROUND].draw()
         self.scene[LAYER_NAME_OBJECTS].draw()
 
-        # Sort dynamic objects
-        dynamic_objects = []
-        dynamic_objects.extend(self.scene[LAYER_NAME_WALLS])
-        dynamic_objects.extend(self.scene[LAYER_NAME_COINS])
-        dynamic_objects.extend(self.scene[LAYER_NAME_CHARACTERS])
-        dynamic_objects.sort(key=lambda s: -s.center_y)
-
-        sprite_list = arcade.SpriteList(use_spatial_hash=True)
-        sprite_list.extend(dynamic_objects)
-        sprite_list.draw()
+        # Sort dynamic objects; Timsort merges the per-chunk runs in linear time
+        self.depth_sorted_list.sort(key=depth_order)
+        self.depth_sorted_list.draw()
 
         # Draw wave particles
         for particle in self.wave_particles:
@@ -504,12 +674,7 @@ class ProceduralForestTerrain(arcade.Window):
             )
 
         # Draw UI
-        arcade.camera.Camera2D().use()
-
-        displacement = math.sqrt(
-            (self.character.center_x - self.start_x) ** 2 +
-            (self.character.center_y - self.start_y) ** 2
-        )
+        self._ui_camera.use()
 
         # Draw energy bar
         self._draw_energy_bar()
@@ -554,13 +719,18 @@ class ProceduralForestTerrain(arcade.Window):
         self.score_text.text = f"Score: {self.score}"
         self.displacement_text.text = f"Displacement: {int(displacement)}"
         self.energy_label.text = f"Quantum Energy: {int(self.quantum_energy)}%"
-        self.energy_label.color = arcade.color.YELLOW if self.wave_mode_active else arcade.color.CYAN
-
         self.health_label.text = f"Health: {int(self.health)}%"
+
+        # Text skips unchanged strings, but setting a color always rewrites its vertices
+        energy_color = arcade.color.YELLOW if self.wave_mode_active else arcade.color.CYAN
+        if self.energy_label.color != energy_color:
+            self.energy_label.color = energy_color
         if time.time() - self.last_damage_time < 0.3:
-            self.health_label.color = arcade.color.RED
+            health_color = arcade.color.RED
         else:
-            self.health_label.color = arcade.color.LIGHT_GREEN
+            health_color = arcade.color.LIGHT_GREEN
+        if self.health_label.color != health_color:
+            self.health_label.color = health_color
 
         self.score_text.draw()
         self.displacement_text.draw()
@@ -0,0 +1,55 @@
+"""Persistent cache of generated chunk layouts."""
+import shelve
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TerrainCache:
+    """
+    Chunk layouts kept in an in-memory LRU backed by a shelve file.
+    Disk writes happen on a background thread so they never block a frame.
+    Safe to use from several threads at once.
+    """
+
+    def __init__(self, path, capacity):
+        self.capacity = capacity
+        self._memory = OrderedDict()
+        self._shelf = shelve.open(path)
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1)
+
+    def get(self, key):
+        """Return the cached layout for key, or None on a miss"""
+        with self._lock:
+            layout = self._memory.get(key)
+            if layout is not None:
+                self._memory.move_to_end(key)
+                return layout
+
+            layout = self._shelf.get(key)
+            if layout is not None:
+                self._remember(key, layout)
+            return layout
+
+    def put(self, key, layout):
+        """Store a layout in memory now and on disk in the background"""
+        with self._lock:
+            self._remember(key, layout)
+        self._writer.submit(self._write, key, layout)
+
+    def close(self):
+        """Flush pending writes and close the shelf"""
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            self._shelf.close()
+
+    def _remember(self, key, layout):
+        self._memory[key] = layout
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+
+    def _write(self, key, layout):
+        with self._lock:
+            self._shelf[key] = layout
@@ -1,6 +1,17 @@
 """Terrain generation functions using quantum states."""
+import math
 from math import sin, cos, pi
+import numpy as np
+from numba import njit
+from constants import CHUNK_SIZE, COIN_SPAWN_CHANCE
+from elements import Elem
 from quantum_state import QuantumState
+from utils import get_chunk_seed
+
+TWO_PI = 2 * pi
+
+# Density bands of terrain_type_from_density; a density in band i becomes Elem(i)
+DENSITY_THRESHOLDS = (0.35, 0.45, 0.60, 0.65, 0.70, 0.75, 0.80)
 
 
 def quantum_terrain(tile_x, tile_y):
@@ -100,4 +111,95 @@ def terrain_type_from_density(d):
     elif d < 0.80:
         return 'log'
     else:
-        return 'bush_small'
\ No newline at end of file
+        return 'bush_small'
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def quantum_terrain_chunk_nb(x0, y0, size, wave_mode, out):
+    """
+    Generate a whole chunk of hybrid terrain in a single fused pass.
+    Writes Elem ids into the (size, size) int8 array ``out``
+    where [i, j] matches hybrid_terrain(x0 + i, y0 + j, wave_mode).
+    """
+    for i in range(size):
+        x = x0 + i
+        for j in range(size):
+            y = y0 + j
+            fx = float(x)
+            fy = float(y)
+
+            # Initial state and first Hadamard are shared by both branches
+            phase = (fx * 0.1234 + fy * 0.4321 + math.sin(fx * 0.1) * math.cos(fy * 0.1)) % TWO_PI
+            phase = (phase + pi / 4 + math.sin(phase)) % TWO_PI
+
+            if wave_mode:
+                use_phase = (x * y) % 5 >= 3
+            else:
+                use_phase = (x + y) % 7 < 5
+
+            if use_phase:
+                # quantum_terrain_phase
+                phase = (phase + fx * 0.1) % TWO_PI
+                phase = (phase + pi / 4 + math.sin(phase)) % TWO_PI
+            else:
+                # quantum_terrain_ry
+                phase = (phase + math.sin(fx * 0.3 + fy * 0.2) * math.cos(phase) * pi) % TWO_PI
+                phase = (phase + pi / 4 + math.sin(phase)) % TWO_PI
+                phase = (phase + math.sin(fy * 0.15) * math.cos(phase) * pi) % TWO_PI
+
+            density = (math.cos(phase) + 1) * 0.5
+
+            element_id = 0
+            for threshold in DENSITY_THRESHOLDS:
+                if density >= threshold:
+                    element_id += 1
+            out[i, j] = element_id
+
+
+def generate_terrain_chunk_random(rng, size):
+    """
+    Classical pseudo-random terrain for comparison with the quantum mode.
+    Draws every random number for the chunk from the numpy Generator at once
+    and returns a (size, size) int8 array of Elem ids.
+    """
+    noise, variant = rng.random((2, size, size), dtype=np.float32)
+
+    tree = np.select(
+        [variant < 0.3, variant < 0.5, variant < 0.7, variant < 0.85],
+        [Elem.TREE_BLOCKS_FALL, Elem.TREE_OAK_FALL, Elem.TREE_DEFAULT_FALL, Elem.TREE_FAT_FALL],
+        Elem.TREE_THIN_FALL
+    )
+    stone = np.where(variant < 0.7, Elem.STONE_TALL, Elem.STONE_LARGE)
+    log = np.where(variant < 0.6, Elem.LOG, Elem.LOG_LARGE)
+
+    return np.select(
+        [noise < 0.35, noise < 0.40, noise < 0.43, noise < 0.48],
+        [tree, stone, log, Elem.BUSH_SMALL],
+        Elem.NONE
+    ).astype(np.int8)
+
+
+def generate_chunk_layout(chunk_x, chunk_y, terrain_mode, wave_mode):
+    """
+    Decide which element or coin goes on each tile of a chunk.
+    Returns a (CHUNK_SIZE, CHUNK_SIZE) int8 array of Elem ids and
+    a tuple of chunk-local (x, y) coin tiles. Only touches its arguments, so it
+    is safe to run on a worker thread.
+    """
+    chunk_seed = get_chunk_seed(chunk_x, chunk_y)
+    rng = np.random.default_rng(chunk_seed)
+
+    # Terrain is generated for the whole chunk in one pass
+    if terrain_mode == 'quantum':
+        element_ids = np.empty((CHUNK_SIZE, CHUNK_SIZE), dtype=np.int8)
+        quantum_terrain_chunk_nb(chunk_x * CHUNK_SIZE, chunk_y * CHUNK_SIZE, CHUNK_SIZE,
+                                 wave_mode, element_ids)
+    else:
+        element_ids = generate_terrain_chunk_random(rng, CHUNK_SIZE)
+
+    # Coins may appear on empty tiles
+    coin_rolls = rng.random((CHUNK_SIZE, CHUNK_SIZE), dtype=np.float32)
+    coin_tiles = np.argwhere((element_ids == Elem.NONE) & (coin_rolls < COIN_SPAWN_CHANCE))
+    coins = tuple((x, y) for x, y in coin_tiles.tolist())
+
+    return element_ids, coins
@@ -2,6 +2,8 @@
 import math
 from constants import TILE_WIDTH, TILE_HEIGHT, CHUNK_SIZE, MASTER_SEED
 
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
 
 def iso_to_screen(iso_x, iso_y):
     """Convert isometric grid coordinates to screen coordinates"""
@@ -10,24 +12,47 @@ def iso_to_screen(iso_x, iso_y):
     return screen_x, screen_y
 
 
+def screen_to_iso(screen_x, screen_y):
+    """Convert screen coordinates to (fractional) isometric grid coordinates"""
+    column = screen_x / (TILE_WIDTH / 2)
+    row = screen_y / (TILE_HEIGHT / 2)
+    return (row + column) / 2, (row - column) / 2
+
+
 def screen_to_chunk(screen_x, screen_y):
-    """Convert screen coordinates to chunk coordinates"""
-    tiles_per_chunk = CHUNK_SIZE
-    chunk_x = int(screen_x / (TILE_WIDTH * tiles_per_chunk / 2))
-    chunk_y = int(screen_y / (TILE_HEIGHT * tiles_per_chunk / 2))
+    """Convert screen coordinates to the coordinates of the chunk under them"""
+    iso_x, iso_y = screen_to_iso(screen_x, screen_y)
+    # Each tile's diamond spans half a tile either side of its center
+    chunk_x = math.floor((iso_x + 0.5) / CHUNK_SIZE)
+    chunk_y = math.floor((iso_y + 0.5) / CHUNK_SIZE)
     return chunk_x, chunk_y
 
 
-def get_chunk_seed(chunk_x, chunk_y):
-    """Generate a unique seed for each chunk using activation function"""
-    center_x = chunk_x * CHUNK_SIZE + CHUNK_SIZE // 2
-    center_y = chunk_y * CHUNK_SIZE + CHUNK_SIZE // 2
+def chunk_screen_bounds(chunk_x, chunk_y):
+    """Screen-space (left, right, bottom, top) covered by a chunk's tiles"""
+    first_x = chunk_x * CHUNK_SIZE
+    first_y = chunk_y * CHUNK_SIZE
+    last_x = first_x + CHUNK_SIZE - 1
+    last_y = first_y + CHUNK_SIZE - 1
+
+    left = iso_to_screen(first_x, last_y)[0] - TILE_WIDTH / 2
+    right = iso_to_screen(last_x, first_y)[0] + TILE_WIDTH / 2
+    bottom = iso_to_screen(first_x, first_y)[1] - TILE_HEIGHT / 2
+    top = iso_to_screen(last_x, last_y)[1] + TILE_HEIGHT / 2
+    return left, right, bottom, top
 
-    combined = MASTER_SEED * math.sin(center_x * 0.1) * math.cos(center_y * 0.1)
-    combined += (center_x * 73856093) ^ (center_y * 19349663)
 
-    activated_seed = int(abs(combined * 1000) % (2 ** 31 - 1))
-    return activated_seed
+def get_chunk_seed(chunk_x, chunk_y):
+    """Generate a unique seed for each chunk by mixing its coordinates with splitmix64"""
+    # Pack both coordinates into one 64-bit word so no two chunks share a seed
+    z = ((chunk_x & 0xFFFFFFFF) << 32) | (chunk_y & 0xFFFFFFFF)
+    z = (z + 0x9E3779B97F4A7C15) & _MASK_64
+    z ^= z >> 30
+    z = (z * 0xBF58476D1CE4E5B9) & _MASK_64
+    z ^= z >> 27
+    z = (z * 0x94D049BB133111EB) & _MASK_64
+    z ^= z >> 31
+    return z ^ MASTER_SEED
 
 
 def get_hitbox_for_element(element):
@@ -36,40 +61,40 @@ def get_hitbox_for_element(element):
     hitbox_height = TILE_HEIGHT * 0.3
 
     if 'tree' in element:
-        return [
+        return (
             (-hitbox_width * 0.45, -hitbox_height * 3.0),
             (hitbox_width * 0.45, -hitbox_height * 3.0),
             (hitbox_width * 0.45, hitbox_height * 0.8),
             (-hitbox_width * 0.45, hitbox_height * 0.8)
-        ]
+        )
     elif element == 'stone_large':
-        return [
+        return (
             (-hitbox_width * 0.8, -hitbox_height * 1.2),
             (hitbox_width * 0.8, -hitbox_height * 1.2),
             (hitbox_width * 0.8, hitbox_height * 0.6),
             (-hitbox_width * 0.8, hitbox_height * 0.6)
-        ]
+        )
     elif element in ['log', 'log_large']:
-        return [
+        return (
             (-hitbox_width * 0.9, -hitbox_height * 1.0),
             (hitbox_width * 0.9, -hitbox_height * 1.0),
             (hitbox_width * 0.9, hitbox_height * 0.5),
             (-hitbox_width * 0.9, hitbox_height * 0.5)
-        ]
+        )
     elif element == 'stone_tall':
-        return [
+        return (
             (-hitbox_width * 0.6, -hitbox_height * 0.8),
             (hitbox_width * 0.6, -hitbox_height * 0.8),
             (hitbox_width * 0.6, hitbox_height * 0.4),
             (-hitbox_width * 0.6, hitbox_height * 0.4)
-        ]
+        )
     else:
-        return [
+        return (
             (-hitbox_width / 2, -hitbox_height / 2),
             (hitbox_width / 2, -hitbox_height / 2),
             (hitbox_width / 2, hitbox_height / 2),
             (-hitbox_width / 2, hitbox_height / 2)
-        ]
+        )
 
 
 def has_collision(element_type):